@@ -1,3 +1,5 @@
+from typing import Mapping
+
 import geopandas as gpd
 import geopandas.testing
 import pandas as pd
@@ -5,9 +7,12 @@ import pytest
 import shapely
 
 from walkability.components.categorise_paths.path_categorisation import (
-    apply_path_category_filters,
     evaluate_quality,
     get_flat_key_combinations,
+    get_path_category,
+    get_smoothness_category,
+    get_surface_type,
+    map_unique_values,
     path_categorisation,
     read_pavement_quality_rankings,
     subset_walkable_paths,
@@ -158,197 +163,171 @@ def test_path_categorisation_empty_input():
     pd.testing.assert_frame_equal(expected_empty_output, categorized_output, check_dtype=False)
 
 
-@pytest.mark.parametrize('category', validation_objects)
-def test_apply_path_category_filters(category: PathCategory):
+@pytest.fixture(scope='module')
+def categorised_ohsome_test_data() -> gpd.GeoDataFrame:
+    """Read and categorise the test paths once for all categories."""
     ohsome_test_data_categorisation = gpd.read_file('test/resources/ohsome_categorisation_response.geojson')
 
-    ohsome_test_data_categorisation['category'] = ohsome_test_data_categorisation.apply(
-        apply_path_category_filters, axis=1
-    )
-
-    ohsome_test_data_categorisation = ohsome_test_data_categorisation[
-        ohsome_test_data_categorisation['category'] == category
-    ]
-
-    assert set(ohsome_test_data_categorisation['osm_id']) == validation_objects[category]
-
-
-def test_evaluate_quality_dedicated_smoothness():
-    """A residential road with a smooth sidewalk made of paving stones."""
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
-                'highway': 'residential',
-                'sidewalk:both': 'yes',
-                'sidewalk:both:smoothness': 'good',
-                'sidewalk:both:surface': 'paving_stones',
-            },
-            'category': PathCategory.DESIGNATED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.GOOD
+    ohsome_test_data_categorisation['category'] = ohsome_test_data_categorisation['osm_tags'].map(get_path_category)
+    return ohsome_test_data_categorisation
 
 
-def test_evaluate_quality_dedicated_surface():
-    """A residential road with a sidewalk made of asphalt but no information on the smoothness of that asphalt."""
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
-                'highway': 'residential',
-                'sidewalk:both': 'yes',
-                'sidewalk:both:surface': 'asphalt',
-            },
-            'category': PathCategory.DESIGNATED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.POTENTIALLY_GOOD
-
+@pytest.mark.parametrize('category', validation_objects)
+def test_get_path_category(category: PathCategory, categorised_ohsome_test_data):
+    ohsome_test_data_categorisation = categorised_ohsome_test_data[categorised_ohsome_test_data['category'] == category]
 
-def test_evaluate_quality_generic_smoothness_and_no_sidewalk():
-    """A smooth residential road made of paving_stones with no sidewalk.
-    Assumption: we walk on the highway and therefore the generic smoothness tag of the highway applies to us.
-    """
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
-                'highway': 'residential',
-                'smoothness': 'good',
-                'surface': 'paving_stones',
-                'sidewalk': 'no',
-            },
-            'category': PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_UNKNOWN_SPEED,
-        }
-    )
+    assert set(ohsome_test_data_categorisation['osm_id']) == validation_objects[category]
 
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
 
-    assert predicted_quality == PavementQuality.GOOD
+@pytest.fixture(scope='module')
+def quality_evaluation_context() -> tuple[tuple, Mapping]:
+    return get_flat_key_combinations(), read_pavement_quality_rankings()
 
 
-def test_evaluate_quality_generic_smoothness_and_sidewalk():
-    """A smooth residential road made of paving_stones with a sidewalk.
-    Assumption: The generic smoothness tag only applies to the highway and not to the sidewalk.
-    """
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
+@pytest.mark.parametrize(
+    'osm_tags,category,expected_quality',
+    [
+        # A residential road with a smooth sidewalk made of paving stones.
+        pytest.param(
+            {
                 'highway': 'residential',
-                'surface': 'paving_stones',
-                'smoothness': 'good',
                 'sidewalk:both': 'yes',
+                'sidewalk:both:smoothness': 'good',
+                'sidewalk:both:surface': 'paving_stones',
             },
-            'category': PathCategory.DESIGNATED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.UNKNOWN
-
-
-def test_evaluate_quality_generic_surface_and_no_sidewalk():
-    """A residential road made of asphalt with no sidewalk.
-    Assumption: we walk on the highway and therefore the generic surface tag of the highway applies to us.
-    """
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
-                'highway': 'residential',
-                'surface': 'asphalt',
-                'sidewalk': 'no',
-            },
-            'category': PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_UNKNOWN_SPEED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.POTENTIALLY_GOOD
-
-
-def test_evaluate_quality_generic_surface_and_sidewalk():
-    """A residential road made of asphalt with a sidewalk.
-    Assumption: The generic surface tag only applies to the highway and not to the sidewalk.
-    """
-    input_row = pd.Series(
-        data={
-            'osm_tags': {'highway': 'residential', 'surface': 'asphalt', 'sidewalk:both': 'yes'},
-            'category': PathCategory.DESIGNATED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.UNKNOWN
-
-
-def test_evaluate_quality_track_with_no_sidewalk():
-    """Assumption: It's a track, and it has no sidewalk i.e. the tracktype applies"""
-    input_row = pd.Series(
-        data={
-            'osm_tags': {
-                'highway': 'track',
-                'tracktype': 'grade1',
-            },
-            'category': PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_MEDIUM_SPEED,
-        }
-    )
-
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
-
-    assert predicted_quality == PavementQuality.POTENTIALLY_GOOD
-
+            PathCategory.DESIGNATED,
+            PavementQuality.GOOD,
+            id='dedicated_smoothness',
+        ),
+        # A residential road with a sidewalk made of asphalt but no information on the smoothness of that asphalt.
+        pytest.param(
+            {'highway': 'residential', 'sidewalk:both': 'yes', 'sidewalk:both:surface': 'asphalt'},
+            PathCategory.DESIGNATED,
+            PavementQuality.POTENTIALLY_GOOD,
+            id='dedicated_surface',
+        ),
+        # A smooth residential road made of paving_stones with no sidewalk.
+        # Assumption: we walk on the highway and therefore the generic smoothness tag of the highway applies to us.
+        pytest.param(
+            {'highway': 'residential', 'smoothness': 'good', 'surface': 'paving_stones', 'sidewalk': 'no'},
+            PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_UNKNOWN_SPEED,
+            PavementQuality.GOOD,
+            id='generic_smoothness_and_no_sidewalk',
+        ),
+        # A smooth residential road made of paving_stones with a sidewalk.
+        # Assumption: The generic smoothness tag only applies to the highway and not to the sidewalk.
+        pytest.param(
+            {'highway': 'residential', 'surface': 'paving_stones', 'smoothness': 'good', 'sidewalk:both': 'yes'},
+            PathCategory.DESIGNATED,
+            PavementQuality.UNKNOWN,
+            id='generic_smoothness_and_sidewalk',
+        ),
+        # A residential road made of asphalt with no sidewalk.
+        # Assumption: we walk on the highway and therefore the generic surface tag of the highway applies to us.
+        pytest.param(
+            {'highway': 'residential', 'surface': 'asphalt', 'sidewalk': 'no'},
+            PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_UNKNOWN_SPEED,
+            PavementQuality.POTENTIALLY_GOOD,
+            id='generic_surface_and_no_sidewalk',
+        ),
+        # A residential road made of asphalt with a sidewalk.
+        # Assumption: The generic surface tag only applies to the highway and not to the sidewalk.
+        pytest.param(
+            {'highway': 'residential', 'surface': 'asphalt', 'sidewalk:both': 'yes'},
+            PathCategory.DESIGNATED,
+            PavementQuality.UNKNOWN,
+            id='generic_surface_and_sidewalk',
+        ),
+        # Assumption: It's a track, and it has no sidewalk i.e. the tracktype applies
+        pytest.param(
+            {'highway': 'track', 'tracktype': 'grade1'},
+            PathCategory.SHARED_WITH_MOTORIZED_TRAFFIC_MEDIUM_SPEED,
+            PavementQuality.POTENTIALLY_GOOD,
+            id='track_with_no_sidewalk',
+        ),
+        # Assumption: There is no information on the surface
+        pytest.param(
+            {'highway': 'residential'},
+            PathCategory.UNKNOWN,
+            PavementQuality.UNKNOWN,
+            id='no_information',
+        ),
+        # Assumption: There is no information on the surface
+        pytest.param(
+            {'highway': 'residential', 'smoothness': 'good'},
+            PathCategory.UNKNOWN,
+            PavementQuality.UNKNOWN,
+            id='we_dont_know_where_we_walk',
+        ),
+    ],
+)
+def test_evaluate_quality(osm_tags, category, expected_quality, quality_evaluation_context):
+    keys, evaluation_dict = quality_evaluation_context
+    input_row = pd.Series(data={'osm_tags': osm_tags, 'category': category})
+
+    predicted_quality = evaluate_quality(row=input_row, keys=keys, evaluation_dict=evaluation_dict)
+
+    assert predicted_quality == expected_quality
+
+
+@pytest.mark.parametrize(
+    'smoothness_tag,expected_smoothness',
+    [
+        ('excellent', SmoothnessCategory.GOOD),
+        ('intermediate', SmoothnessCategory.MEDIOCRE),
+        ('bad', SmoothnessCategory.POOR),
+        ('impassable', SmoothnessCategory.VERY_POOR),
+        ('not_a_smoothness', SmoothnessCategory.UNKNOWN),
+        (None, SmoothnessCategory.UNKNOWN),
+        (float('nan'), SmoothnessCategory.UNKNOWN),
+    ],
+)
+def test_get_smoothness_category(smoothness_tag, expected_smoothness):
+    assert get_smoothness_category(smoothness_tag) == expected_smoothness
+
+
+@pytest.mark.parametrize(
+    'surface_tag,expected_surface',
+    [
+        ('asphalt', SurfaceType.CONTINUOUS_PAVEMENT),
+        ('paving_stones', SurfaceType.MODULAR_PAVEMENT),
+        ('sett', SurfaceType.COBBLESTONE),
+        ('wood', SurfaceType.OTHER_PAVED),
+        ('fine_gravel', SurfaceType.GRAVEL),
+        ('dirt', SurfaceType.GROUND),
+        ('sand', SurfaceType.OTHER_UNPAVED),
+        ('not_a_surface', SurfaceType.UNKNOWN),
+        (None, SurfaceType.UNKNOWN),
+        (float('nan'), SurfaceType.UNKNOWN),
+    ],
+)
+def test_get_surface_type(surface_tag, expected_surface):
+    assert get_surface_type(surface_tag) == expected_surface
 
-def test_evaluate_quality_no_information():
-    """Assumption: There is no information on the surface"""
-    input_row = pd.Series(
-        data={
-            'osm_tags': {'highway': 'residential'},
-            'category': PathCategory.UNKNOWN,
-        }
-    )
 
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
-    )
+def test_map_unique_values():
+    calls = []
 
-    assert predicted_quality == PavementQuality.UNKNOWN
+    def categorise(value):
+        calls.append(value)
+        return get_smoothness_category(value)
 
+    values = pd.Series(['good', None, 'bad', 'good', None], index=[3, 5, 7, 9, 11])
 
-def test_evaluate_quality_we_dont_know_where_we_walk():
-    """Assumption: There is no information on the surface"""
-    input_row = pd.Series(
-        data={
-            'osm_tags': {'highway': 'residential', 'smoothness': 'good'},
-            'category': PathCategory.UNKNOWN,
-        }
-    )
+    received = map_unique_values(values, categorise)
 
-    predicted_quality = evaluate_quality(
-        row=input_row, keys=get_flat_key_combinations(), evaluation_dict=read_pavement_quality_rankings()
+    expected = pd.Series(
+        [
+            SmoothnessCategory.GOOD,
+            SmoothnessCategory.UNKNOWN,
+            SmoothnessCategory.POOR,
+            SmoothnessCategory.GOOD,
+            SmoothnessCategory.UNKNOWN,
+        ],
+        index=[3, 5, 7, 9, 11],
     )
-
-    assert predicted_quality == PavementQuality.UNKNOWN
+    pd.testing.assert_series_equal(received, expected)
+    assert len(calls) == 3
 
 
 def test_filter_walkable_paths():
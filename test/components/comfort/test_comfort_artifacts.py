@@ -2,7 +2,7 @@ import geopandas as gpd
 import shapely
 from pydantic_extra_types.color import Color
 
-from walkability.components.comfort.comfort_artifacts import assign_color, assign_label
+from walkability.components.comfort.comfort_artifacts import assign_color, assign_labels
 from walkability.components.comfort.comfort_poi_filters import PointsOfInterest
 
 
@@ -22,12 +22,12 @@ def test_assign_color(default_max_walking_distance_map):
     assert received['color'].to_list() == [Color('black'), Color('#f2cbb7'), Color('red')]
 
 
-def test_assign_label(default_max_walking_distance_map):
+def test_assign_labels(default_max_walking_distance_map):
     poi_type = PointsOfInterest.SEATING
     max_walking_distance = default_max_walking_distance_map[poi_type]
 
     path = shapely.LineString([(0.0, 0.0), (1.0, 1.0)])
     paths = gpd.GeoDataFrame(data={'value': [0.0, 200, None]}, geometry=[shapely.Point(1.0, 1.0), path, path])
 
-    computed_labels = paths.apply(assign_label, poi_type=poi_type, max_walking_distance=max_walking_distance, axis=1)
+    computed_labels = assign_labels(paths, poi_type=poi_type, max_walking_distance=max_walking_distance)
     assert computed_labels.to_list() == ['benches', '< 200m', '> 333m']
@@ -1,6 +1,7 @@
 import geopandas as gpd
 import numpy as np
 import pytest
+import rasterio
 import shapely
 from geopandas.testing import assert_geodataframe_equal, assert_geoseries_equal
 from numpy.testing import assert_almost_equal
@@ -13,7 +14,7 @@ from walkability.components.shade.utility.analysis import (
     create_tile_windows,
     filter_tiles_to_paths,
     get_shaded_path_stats,
-    mask_and_crop,
+    read_masked,
 )
 from walkability.components.utils.geometry import CAN_DEFAULT_CRS
 
@@ -116,10 +117,9 @@ def test_create_tile_windows_bounds_smaller_than_resolution():
     assert_geoseries_equal(expected, received)
 
 
-def test_mask_and_crop_with_mask_file():
-    received_masked_data, _ = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster2.tif',
-    )
+def test_read_masked_with_mask_file():
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster2.tif') as src:
+        received_masked_data, _ = read_masked(src=src)
 
     assert isinstance(received_masked_data, np.ndarray)
 
@@ -127,50 +127,43 @@ def test_mask_and_crop_with_mask_file():
     assert set(np.unique(received_masked_data)) == {3, 255}
 
 
-def test_mask_and_crop_missing_mask_file():
-    received_masked_data, _ = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif',
-    )
+def test_read_masked_missing_mask_file():
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif') as src:
+        received_masked_data, _ = read_masked(src=src)
 
     # no `nodata` values because nothing is masked out
     assert set(np.unique(received_masked_data)) == {1, 3}
 
 
-def test_mask_and_crop_with_min_value():
-    received_masked_data, _ = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif',
-        min_value=2,
-    )
+def test_read_masked_with_min_value():
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif') as src:
+        received_masked_data, _ = read_masked(src=src, min_value=2)
 
     # `1` values were set to `nodata`, i.e. 'unshaded'
     assert set(np.unique(received_masked_data)) == {3, 255}
 
 
-def test_mask_and_crop_is_cropped():
-    received_masked_data, _ = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif',
-        windowed_bounds=(1.3692e06, 6.1432e06, 1.3695e06, 6.1435e06),
-    )
+def test_read_masked_is_cropped():
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif') as src:
+        received_masked_data, _ = read_masked(src=src, windowed_bounds=(1.3692e06, 6.1432e06, 1.3695e06, 6.1435e06))
 
     assert received_masked_data.shape == (30, 30)
 
 
-def test_mask_and_crop_always_2d():
+def test_read_masked_always_2d():
     window_bounds = [1369300, 6143300, 1369310, 6143400]
 
-    received_data, _ = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif',
-        windowed_bounds=window_bounds,
-    )
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif') as src:
+        received_data, _ = read_masked(src=src, windowed_bounds=window_bounds)
 
     assert received_data.shape == (10, 1)
 
 
-def test_mask_and_crop_profile_matches_data():
-    received_masked_data, received_profile = mask_and_crop(
-        raster_file=TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif',
-        windowed_bounds=(1.3692e06, 6.1432e06, 1.3695e06, 6.1435e06),
-    )
+def test_read_masked_profile_matches_data():
+    with rasterio.open(TEST_RESOURCES_DIR / 'shade/mock_tree_raster1.tif') as src:
+        received_masked_data, received_profile = read_masked(
+            src=src, windowed_bounds=(1.3692e06, 6.1432e06, 1.3695e06, 6.1435e06)
+        )
 
     assert received_masked_data.shape[0] == received_profile['height']
     assert received_masked_data.shape[1] == received_profile['width']
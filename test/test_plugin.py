@@ -14,6 +14,14 @@ def test_plugin_info_request(operator):
     assert isinstance(operator.info(), PluginInfo)
 
 
+def test_plugin_info_returns_independent_copies(operator):
+    first_info = operator.info()
+    second_info = operator.info()
+
+    assert first_info is not second_info
+    assert first_info == second_info
+
+
 @pytest.fixture
 def mock_detour_factor_calculation(expected_detour_factors):
     # This higher level mock exists because mocking a response for the api calls required for all hexcells of the entired default_aoi, is massive
@@ -1,5 +1,7 @@
 import logging
-from typing import Dict, Generator, List, Set
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Sequence, Set, Tuple
 
 import geopandas as gpd
 import pandas as pd
@@ -28,12 +30,18 @@ def path_categorisation(
     rankings = read_pavement_quality_rankings()
     keys = get_flat_key_combinations()
 
-    geometries['category'] = geometries.apply(apply_path_category_filters, axis=1, result_type='reduce')
+    # Categorise on the tags directly, which avoids building a Series for every row as in a row-wise apply
+    geometries['category'] = geometries['osm_tags'].map(get_path_category)
     geometries['quality'] = geometries.apply(
         lambda row: evaluate_quality(row, keys, rankings), axis=1, result_type='reduce'
     )
-    geometries['smoothness'] = geometries.apply(apply_path_smoothness_filters, axis=1, result_type='reduce')
-    geometries['surface'] = geometries.apply(apply_path_surface_filters, axis=1, result_type='reduce')
+
+    # Pull the single-tag attributes out into columns once and evaluate each distinct tag value only once
+    tag_columns = pd.DataFrame.from_records(
+        geometries['osm_tags'].tolist(), index=geometries.index, columns=['smoothness', 'surface']
+    )
+    geometries['smoothness'] = map_unique_values(tag_columns['smoothness'], get_smoothness_category)
+    geometries['surface'] = map_unique_values(tag_columns['surface'], get_surface_type)
 
     visible_geometries = geometries[geometries.category.isin(PathCategory.get_visible())]
     visible_geometries['rating'] = visible_geometries.category.apply(lambda category: PATH_RATING_MAP[category])
@@ -51,9 +59,7 @@ def path_categorisation(
     return visible_geometries
 
 
-def apply_path_category_filters(row: pd.Series) -> PathCategory:
-    tags = row['osm_tags']
-    # TODO This reinstantiates a class again and again in the apply call, maybe think about storing the contained data in a better way.
+def get_path_category(tags: dict) -> PathCategory:
     filters = PathCategoryFilters(tags=tags)
     match tags:
         case x if filters.inaccessible(x):
@@ -77,7 +83,7 @@ def apply_path_category_filters(row: pd.Series) -> PathCategory:
 
 
 def evaluate_quality(
-    row: pd.Series, keys: List[str], evaluation_dict: Dict[str, Dict[str, PavementQuality]]
+    row: pd.Series, keys: Sequence[str], evaluation_dict: Mapping[str, Mapping[str, PavementQuality]]
 ) -> PavementQuality:
     if row['category'] == PathCategory.UNKNOWN:
         return PavementQuality.UNKNOWN
@@ -116,15 +122,17 @@ def evaluate_quality(
     return evaluation_dict.get(match_key, {}).get(match_value, PavementQuality.UNKNOWN)
 
 
-def read_pavement_quality_rankings() -> Dict[str, Dict[str, PavementQuality]]:
+@cache
+def read_pavement_quality_rankings() -> Mapping[str, Mapping[str, PavementQuality]]:
     with open('resources/components/categorise_paths/value_ranking.yaml') as f:
         ranking_list = yaml.safe_load(f)
 
     result = {}
     for key, value_list in ranking_list.items():
         rankings = {item['value']: PavementQuality(item['ranking']) for item in value_list}
-        result[key] = rankings
-    return result
+        result[key] = MappingProxyType(rankings)
+    # The rankings are cached and shared by all callers, so they are returned read-only
+    return MappingProxyType(result)
 
 
 def get_sidewalk_key_combinations() -> Dict[str, List[str]]:
@@ -139,10 +147,11 @@ def get_sidewalk_key_combinations() -> Dict[str, List[str]]:
     return sidewalk_tag_combinations
 
 
-def get_flat_key_combinations() -> List[str]:
+@cache
+def get_flat_key_combinations() -> Tuple[str, ...]:
     combinations = get_sidewalk_key_combinations()
     explode_tags = combinations['smoothness'] + combinations['surface'] + ['smoothness', 'surface', 'tracktype']
-    return explode_tags
+    return tuple(explode_tags)
 
 
 def subset_walkable_paths(
@@ -153,8 +162,11 @@ def subset_walkable_paths(
         yield path[path['category'].isin(walkable_categories)]
 
 
-def apply_path_smoothness_filters(row: pd.Series) -> SmoothnessCategory:
-    smoothness_tag = row['osm_tags'].get('smoothness')
+def map_unique_values(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    return values.map({value: func(value) for value in values.unique()})
+
+
+def get_smoothness_category(smoothness_tag: Optional[str]) -> SmoothnessCategory:
     match smoothness_tag:
         case 'very_bad' | 'horrible' | 'very_horrible' | 'impassable':
             return SmoothnessCategory.VERY_POOR
@@ -168,8 +180,7 @@ def apply_path_smoothness_filters(row: pd.Series) -> SmoothnessCategory:
             return SmoothnessCategory.UNKNOWN
 
 
-def apply_path_surface_filters(row: pd.Series) -> SurfaceType:
-    surface_tag = row['osm_tags'].get('surface')
+def get_surface_type(surface_tag: Optional[str]) -> SurfaceType:
     match surface_tag:
         case 'asphalt' | 'concrete':
             return SurfaceType.CONTINUOUS_PAVEMENT
@@ -4,28 +4,28 @@ from walkability.components.utils.misc import safe_string_to_float
 
 
 class PathCategoryFilters:
-    # TODO instantiating this class over and over for filtering in an apply is a bad idea, think about how to store the necessary data without re-instantiating it on every check
-    def __init__(self, tags: dict, speed_category_max: Dict[str, float] = None):
-        # Potential: potentially walkable features (to be restricted by AND queries)
-        self._potential_highway_values = (
-            'primary',
-            'primary_link',
-            'secondary',
-            'secondary_link',
-            'tertiary',
-            'tertiary_link',
-            'road',
-            'cycleway',
-            'unclassified',
-            'residential',
-            'track',
-        )
-        self._potential_highway_values_low_speed = (
-            'living_street',
-            'service',
-        )
-        self._potential_highway_values_all = self._potential_highway_values + self._potential_highway_values_low_speed
+    # Potential: potentially walkable features (to be restricted by AND queries)
+    # These are static, so they are defined once on the class instead of for every instance (i.e. every path)
+    _potential_highway_values = (
+        'primary',
+        'primary_link',
+        'secondary',
+        'secondary_link',
+        'tertiary',
+        'tertiary_link',
+        'road',
+        'cycleway',
+        'unclassified',
+        'residential',
+        'track',
+    )
+    _potential_highway_values_low_speed = (
+        'living_street',
+        'service',
+    )
+    _potential_highway_values_all = _potential_highway_values + _potential_highway_values_low_speed
 
+    def __init__(self, tags: dict, speed_category_max: Dict[str, float] = None):
         self.max_speed = PathCategoryFilters.extract_speed(tags=tags)
 
         self.speed_category_max = speed_category_max or {'slow': 10, 'medium': 30, 'fast': 50}
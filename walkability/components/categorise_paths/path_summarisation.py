@@ -47,7 +47,7 @@ def summarise_by_area(
     if boundaries.shape[0] <= 1:
         data = {}
     else:
-        log.debug(f'Summarising paths into {boundaries.shape[0]} boundaries')
+        log.debug('Summarising paths into %s boundaries', boundaries.shape[0])
 
         stats = stats.overlay(boundaries, how='identity')
         stats = stats.to_crs(projected_crs)
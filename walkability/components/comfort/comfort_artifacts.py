@@ -1,7 +1,6 @@
 import logging
 
 import geopandas as gpd
-import numpy as np
 import pandas as pd
 import shapely
 from climatoology.base.artifact_creators import Artifact, ArtifactMetadata, Legend, create_vector_artifact
@@ -9,6 +8,7 @@ from climatoology.base.computation import ComputationResources
 from mobility_tools.settings import ORSSettings
 from ohsome import OhsomeClient
 from pydantic_extra_types.color import Color
+from pyproj import CRS
 
 from walkability.components.comfort.comfort_poi_filters import PointsOfInterest, distance_enrich_paths
 from walkability.components.utils.geometry import get_buffered_aoi
@@ -16,11 +16,18 @@ from walkability.components.utils.misc import Topics, generate_colors
 
 log = logging.getLogger(__name__)
 N_BINS = 5
+POI_COLORS = {
+    PointsOfInterest.SEATING: Color('black'),
+    PointsOfInterest.DRINKING_WATER: Color('darkblue'),
+    PointsOfInterest.PUBLIC_TOILET: Color('purple'),
+    PointsOfInterest.SHELTERED_BENCH: Color('brown'),
+}
 
 
 def compute_comfort_artifacts(
     paths: gpd.GeoDataFrame,
     aoi: shapely.MultiPolygon,
+    projected_crs: CRS,
     max_walking_distance_map: dict[PointsOfInterest, float],
     ohsome_client: OhsomeClient,
     ors_settings: ORSSettings,
@@ -33,13 +40,13 @@ def compute_comfort_artifacts(
         PointsOfInterest.PUBLIC_TOILET,
         PointsOfInterest.SHELTERED_BENCH,
     ]:
-        log.debug(f'Computing Comfort for {poi_type}')
+        log.debug('Computing Comfort for %s', poi_type)
         max_walking_distance = max_walking_distance_map[poi_type]
         bin_size = int(max_walking_distance / N_BINS)
         bins = [x for x in range(bin_size, int(max_walking_distance) + 1, bin_size)]
         max_walking_distance = max(bins)
 
-        buffered_aoi = get_buffered_aoi(aoi, max_walking_distance)
+        buffered_aoi = get_buffered_aoi(aoi, max_walking_distance, projected_crs)
         enriched_paths = distance_enrich_paths(
             paths=paths,
             aoi=buffered_aoi,
@@ -75,11 +82,10 @@ def build_isodistance_artifact(
     log.debug('Building isodistance artifact')
     cleaned_data = clean_data(data, max_walking_distance, min_value=min(bins), poi_type=poi_type)
 
-    legend = {}
+    # Group once instead of filtering the full frame for every label
+    label_colors = cleaned_data.groupby('label')['color'].agg(lambda colors: colors.mode().loc[0])
     unique_labels = cleaned_data.sort_values('value').label.unique()
-    for label in unique_labels:
-        legend_color = cleaned_data.loc[cleaned_data['label'] == label, 'color'].mode().loc[0]
-        legend.update({label: legend_color})
+    legend = label_colors.loc[unique_labels].to_dict()
 
     return create_vector_artifact(
         data=cleaned_data,
@@ -102,7 +108,7 @@ def clean_data(
     data: gpd.GeoDataFrame, max_walking_distance: float, min_value: float, poi_type: PointsOfInterest
 ) -> gpd.GeoDataFrame:
     data = data[['value', 'geometry']]
-    data['label'] = data.apply(assign_label, poi_type=poi_type, max_walking_distance=max_walking_distance, axis=1)
+    data['label'] = assign_labels(data, poi_type=poi_type, max_walking_distance=max_walking_distance)
 
     data = assign_color(data, max_walking_distance=max_walking_distance, min_value=min_value, poi_type=poi_type)
 
@@ -115,25 +121,19 @@ def assign_color(
     data['color'] = generate_colors(
         data.value, 'coolwarm', min_value, max_value=max_walking_distance, bad_color=Color('red').as_hex()
     )
-    match poi_type:
-        case PointsOfInterest.SEATING:
-            point_color = Color('black')
-        case PointsOfInterest.DRINKING_WATER:
-            point_color = Color('darkblue')
-        case PointsOfInterest.PUBLIC_TOILET:
-            point_color = Color('purple')
-        case PointsOfInterest.SHELTERED_BENCH:
-            point_color = Color('brown')
-        case _:
-            raise NotImplementedError('POI not supported by coloring function')
+    point_color = POI_COLORS.get(poi_type)
+    if point_color is None:
+        raise NotImplementedError('POI not supported by coloring function')
     data.loc[data.geom_type == 'Point', 'color'] = point_color
 
     return data
 
 
-def assign_label(row: pd.Series, poi_type: PointsOfInterest, max_walking_distance: float) -> str:
-    match row.geometry.geom_type:
-        case 'Point':
-            return poi_type.value
-        case _:
-            return f'> {int(max_walking_distance)}m' if np.isnan(row['value']) else f'< {int(row["value"])}m'
+def assign_labels(data: gpd.GeoDataFrame, poi_type: PointsOfInterest, max_walking_distance: float) -> pd.Series:
+    labels = pd.Series(f'> {int(max_walking_distance)}m', index=data.index, dtype=object)
+
+    has_value = data['value'].notna()
+    labels[has_value] = '< ' + data.loc[has_value, 'value'].astype(int).astype(str) + 'm'
+    labels[data.geom_type == 'Point'] = poi_type.value
+
+    return labels
@@ -31,14 +31,14 @@ def distance_enrich_paths(
     ohsome_client: OhsomeClient,
     ors_settings: ORSSettings,
 ) -> gpd.GeoDataFrame:
-    log.debug(f'Requesting {poi_type} from ohsome')
+    log.debug('Requesting %s from ohsome', poi_type)
     pois = request_pois(aoi, poi_type, ohsome_client)
 
     if pois.empty:
         paths = paths.copy(deep=True)
         paths['value'] = numpy.nan
 
-        log.debug(f'No POIs of {poi_type} in this area, returning paths unchanged')
+        log.debug('No POIs of %s in this area, returning paths unchanged', poi_type)
         return paths
 
     pois['value'] = 0.0
@@ -94,7 +94,7 @@ def generate_isochrones(
     pois: gpd.GeoSeries, bins: list[int], ors_settings: ORSSettings | None = None
 ) -> gpd.GeoDataFrame:
     num_pois = len(pois)
-    log.debug(f'Generating isochrones for {num_pois} POIs')
+    log.debug('Generating isochrones for %s POIs', num_pois)
 
     if num_pois > ors_settings.ors_isochrone_max_request_number:
         iso = approximate_isochrones(pois, bins)
@@ -108,16 +108,14 @@ def generate_isochrones(
 
 def approximate_isochrones(pois: gpd.GeoSeries, bins: list[int]) -> gpd.GeoDataFrame:
     log.debug('Using naive buffers')
-    iso_list = []
     crs = pois.estimate_utm_crs()
-    local_pois = pois.copy(deep=True).to_crs(crs)
-    for curr_bin in bins:
-        iso = local_pois.buffer(curr_bin).to_frame(name='geometry')
-        iso['value'] = curr_bin
-        iso_list.append(iso)
-
-    iso_df: gpd.GeoDataFrame = gpd.GeoDataFrame(pd.concat(iso_list))
-    iso_df.set_crs(crs, inplace=True)
+    local_pois = pois.to_crs(crs).to_numpy()
+
+    # Buffer every POI by every bin in one vectorised call instead of one GeoSeries operation per bin
+    values = numpy.repeat(bins, len(local_pois))
+    buffers = shapely.buffer(numpy.tile(local_pois, len(bins)), values, quad_segs=16)
+
+    iso_df = gpd.GeoDataFrame(data={'value': values}, geometry=buffers, crs=crs)
     iso_df.to_crs(CAN_DEFAULT_CRS, inplace=True)
 
     return iso_df
@@ -157,13 +155,19 @@ def apply_isochrones_to_paths(iso: gpd.GeoDataFrame, paths: gpd.GeoDataFrame) ->
     grouped_iso = iso.dissolve(by=['value'])
 
     path_list = []
-    remaining_paths = paths.geometry.copy(deep=True)
+    remaining_paths = paths.geometry
     for value, geometry in grouped_iso.geometry.items():
         value_paths = remaining_paths.clip(geometry, keep_geom_type=True).to_frame()
         value_paths['value'] = value
         path_list.append(value_paths)
 
-        remaining_paths = remaining_paths.difference(geometry).rename('geometry')
+        # Only paths intersecting the isochrone can change, so skip the costly difference for all others
+        intersecting = remaining_paths.sindex.query(geometry, predicate='intersects')
+        remaining_geometries = remaining_paths.to_numpy(copy=True)
+        remaining_geometries[intersecting] = shapely.difference(remaining_geometries[intersecting], geometry)
+        remaining_paths = gpd.GeoSeries(
+            remaining_geometries, index=remaining_paths.index, crs=remaining_paths.crs, name='geometry'
+        )
         remaining_paths = remaining_paths[~remaining_paths.geometry.is_empty]
 
     path_list.append(remaining_paths.to_frame())
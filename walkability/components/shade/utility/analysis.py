@@ -22,6 +22,8 @@ log = get_climatoology_logger(__name__)
 
 MIN_TREE_HEIGHT = 2
 MAX_RASTER_EDGE_LENGTH = 4096
+# A larger block cache and multithreaded decompression for reading the (compressed) canopy tiles
+GDAL_READ_OPTIONS = {'GDAL_CACHEMAX': 512, 'GDAL_NUM_THREADS': 'ALL_CPUS'}
 
 
 def get_shaded_path_stats(
@@ -44,45 +46,49 @@ def get_shaded_path_stats(
     tiles_in_aoi = filter_tiles_to_paths(tiles=tile_spec, paths=paths)
 
     paths_out = []
+    projected_paths = None
     tiles_progbar = tqdm(tiles_in_aoi.index)
     for tile_id in tiles_progbar:
         tiles_progbar.set_description(f'Downloading {tile_id} ...')
         canopy_path = download_shade_tile(tile_id=tile_id, shade_client=shade_client, shade_config=shade_config)
 
-        with rasterio.open(canopy_path, 'r') as src:
+        # Keep the tile open for all its windows rather than re-opening it for the metadata and every window read
+        with rasterio.Env(**GDAL_READ_OPTIONS), rasterio.open(canopy_path, 'r') as src:
             raster_crs = src.profile['crs']
-            raster_bounds = src.bounds
             resolution = min(abs(src.transform.a), abs(src.transform.e))
 
-        tile_windows = create_tile_windows(
-            bounds=raster_bounds, resolution=resolution, max_length_pixels=MAX_RASTER_EDGE_LENGTH
-        )
+            tile_windows = create_tile_windows(
+                bounds=src.bounds, resolution=resolution, max_length_pixels=MAX_RASTER_EDGE_LENGTH
+            )
 
-        tiles_progbar.set_description(f'Clipping paths for {tile_id} ...')
-        projected_paths = paths.to_crs(raster_crs)
+            # Tiles generally share a CRS, so only re-project the paths when it changes
+            if projected_paths is None or projected_paths.crs != raster_crs:
+                tiles_progbar.set_description(f'Projecting paths for {tile_id} ...')
+                projected_paths = paths.to_crs(raster_crs)
 
-        for w_id, window in tile_windows.items():
-            tiles_progbar.set_description(f'Processing tile {tile_id}, window {w_id} ...')
+            for w_id, window in tile_windows.items():
+                tiles_progbar.set_description(f'Processing tile {tile_id}, window {w_id} ...')
 
-            clipped_paths = projected_paths.clip(window)
-            if clipped_paths.empty:
-                continue
+                clipped_paths = projected_paths.clip(window)
+                if clipped_paths.empty:
+                    continue
 
-            canopy_data, canopy_profile = mask_and_crop(
-                raster_file=canopy_path,
-                windowed_bounds=window.bounds,
-                min_value=min_tree_height,
-            )
+                canopy_data, canopy_profile = read_masked(
+                    src=src,
+                    windowed_bounds=window.bounds,
+                    min_value=min_tree_height,
+                )
 
-            covered_paths = compute_coverage(
-                paths=clipped_paths, shade_raster=canopy_data, shade_profile=canopy_profile
-            )
-            paths_out.append(covered_paths)
+                covered_paths = compute_coverage(
+                    paths=clipped_paths, shade_raster=canopy_data, shade_profile=canopy_profile
+                )
+                paths_out.append(covered_paths)
 
     shaded_paths = pd.concat(paths_out)
-    shaded_paths = shaded_paths.to_crs(shaded_paths.estimate_utm_crs())
+    # Project only the geometries for the lengths, instead of round-tripping the whole frame through UTM
+    lengths = shaded_paths.geometry.to_crs(shaded_paths.estimate_utm_crs()).length
     shaded_paths = (
-        shaded_paths.assign(length=shaded_paths.length, length_shaded=shaded_paths.length * shaded_paths['prop_shaded'])
+        shaded_paths.assign(length=lengths, length_shaded=lengths * shaded_paths['prop_shaded'])
         .to_crs(paths.crs)
         .drop(columns='prop_shaded')
     )
@@ -94,8 +100,9 @@ def filter_tiles_to_paths(tiles: gpd.GeoDataFrame, paths: gpd.GeoDataFrame) -> g
     """Subset the `tiles` and return only the tiles that intersect with the `paths`."""
     target_idx = tiles.sindex.intersection(paths.total_bounds)
     target_tiles = tiles.iloc[target_idx]
-    target_idx_intersects = [i for i, t in target_tiles.items() if paths.intersects(t).any()]
-    return target_tiles.loc[target_idx_intersects]
+    # A single bulk query against the paths' spatial index evaluates the predicate on prepared geometries
+    tile_idx_intersects, _ = paths.sindex.query(target_tiles.geometry, predicate='intersects')
+    return target_tiles.iloc[np.unique(tile_idx_intersects)]
 
 
 def create_tile_windows(
@@ -127,50 +134,48 @@ def create_tile_windows(
     return subtiles
 
 
-def mask_and_crop(
-    raster_file: Path,
+def read_masked(
+    src: rasterio.DatasetReader,
     windowed_bounds: tuple[int, int, int, int] = None,
     min_value: float = None,
     nodata: int = 255,
 ) -> tuple[np.ndarray, dict[str, Any]]:
     """
-    Read the `windowed_bounds` from the `raster_file`, and use the `nodata` value to apply the raster's mask and to
-    mask out any values lower than `min_value`.
+    Read the `windowed_bounds` from the opened raster dataset `src`, and use the `nodata` value to apply the raster's
+    mask and to mask out any values lower than `min_value`.
 
-    :param raster_file: location of raw raster file
-    :param windowed_bounds: bounds to read from the raster in `raster_file`
+    :param src: opened raster dataset
+    :param windowed_bounds: bounds to read from the raster in `src`
     :param min_value: if provided, mask all raster cells where the value is less than `min_value`
     :param nodata: nodata value to apply for the mask
     :return: tuple containing: the 2D array of the masked data, and its rasterio profile
     """
+    profile = src.meta
 
-    with rasterio.open(raster_file) as src:
-        profile = src.meta
+    if windowed_bounds is None:
+        window = Window(col_off=0, row_off=0, width=src.shape[1], height=src.shape[0])
+    else:
+        window = window_from_bounds(*windowed_bounds, transform=src.transform)
 
-        if windowed_bounds is None:
-            window = Window(col_off=0, row_off=0, width=src.shape[1], height=src.shape[0])
-        else:
-            window = window_from_bounds(*windowed_bounds, transform=src.transform)
+    data = src.read(window=window)
 
-        data = src.read(window=window)
+    if src.mask_flag_enums[0] == [MaskFlags.per_dataset]:
+        log.debug('Applying mask for %s', Path(src.name).name)
 
-        if src.mask_flag_enums[0] == [MaskFlags.per_dataset]:
-            log.debug(f'Applying mask for {raster_file.name}')
+        mask = src.read_masks(window=window)
 
-            mask = src.read_masks(window=window)
+        data[mask == 255] = nodata  # 255 is the nodata value in the .msk files according to the docs
 
-            data[mask == 255] = nodata  # 255 is the nodata value in the .msk files according to the docs
+    elif all([m in (MaskFlags.all_valid, MaskFlags.nodata) for m in src.mask_flag_enums[0]]):
+        log.debug('Mask already applied to raw data')
 
-        elif all([m in (MaskFlags.all_valid, MaskFlags.nodata) for m in src.mask_flag_enums[0]]):
-            log.debug('Mask already applied to raw data')
-
-        else:
-            raise RuntimeError(
-                f"Mask for raster file at {raster_file} with mask_flag_enums={src.mask_flag_enums} can't be handled"
-            )
+    else:
+        raise RuntimeError(
+            f"Mask for raster file at {src.name} with mask_flag_enums={src.mask_flag_enums} can't be handled"
+        )
 
-        if min_value:
-            data[data < min_value] = nodata
+    if min_value:
+        data[data < min_value] = nodata
 
     # Remove dimension for raster bands, if present
     if data.ndim > 2:
@@ -195,19 +200,20 @@ def compute_coverage(
     crs_in = paths.crs
     paths = paths.to_crs(shade_profile['crs'])
 
-    zstat = zonal_stats(
-        vectors=paths,
-        raster=shade_raster,
-        affine=shade_profile['transform'],
-        nodata=shade_profile['nodata'],
-        stats=['count', 'nodata'],
-        all_touched=True,
-        geojson_out=True,
+    # Read the stats straight back onto the paths instead of round-tripping every path through GeoJSON features
+    zstat = pd.DataFrame(
+        zonal_stats(
+            vectors=paths.geometry,
+            raster=shade_raster,
+            affine=shade_profile['transform'],
+            nodata=shade_profile['nodata'],
+            stats=['count', 'nodata'],
+            all_touched=True,
+        ),
+        index=paths.index,
     )
 
-    covered_paths = gpd.GeoDataFrame.from_features(zstat, crs=shade_profile['crs'])
-    covered_paths['prop_shaded'] = covered_paths['count'] / covered_paths[['count', 'nodata']].sum(axis='columns')
-    covered_paths = covered_paths.drop(columns=['count', 'nodata'])
+    covered_paths = paths.assign(prop_shaded=zstat['count'] / zstat[['count', 'nodata']].sum(axis='columns'))
     covered_paths = covered_paths.to_crs(crs_in)
 
     return covered_paths
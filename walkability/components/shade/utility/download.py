@@ -52,7 +52,7 @@ def download_shade_tile(
         download_dir=shade_config.cache_dir,
     )
     if canopy_file is None:
-        log.error(f'Failed to download tree canopy data for tile {tile_id}, cancelling shade computation')
+        log.error('Failed to download tree canopy data for tile %s, cancelling shade computation', tile_id)
         raise ClimatoologyUserError('Failed to download tree canopy tiles, please try again later')
 
     mask_file = shade_config.cloud_mask_path / f'{tile_id}.tif.msk'
@@ -63,7 +63,7 @@ def download_shade_tile(
         download_dir=shade_config.cache_dir,
     )
     if mask_file is None:
-        log.debug(f'{mask_file} was unable to be downloaded')
+        log.debug('%s was unable to be downloaded', mask_file)
 
     return canopy_file
 
@@ -88,10 +88,12 @@ def download_data(
     """
     local_file = download_dir / s3_path.name
     if not local_file.exists() or overwrite:
-        log.debug(f"Downloading file '{s3_path}' from bucket '{bucket}' to: {download_dir}")
+        log.debug("Downloading file '%s' from bucket '%s' to: %s", s3_path, bucket, download_dir)
         try:
             s3_client.download_file(bucket, str(s3_path), local_file)
         except ClientError:
             local_file = None
-            log.warning(f'Failed to download {s3_path} from {bucket}, to local directory {download_dir}', exc_info=True)
+            log.warning(
+                'Failed to download %s from %s, to local directory %s', s3_path, bucket, download_dir, exc_info=True
+            )
     return local_file
@@ -1,3 +1,5 @@
+from functools import cache
+
 import geopandas as gpd
 import shapely
 from pyproj import CRS, Transformer
@@ -6,16 +8,20 @@ from shapely.ops import transform
 CAN_DEFAULT_CRS = CRS('EPSG:4326')
 
 
-def get_buffered_aoi(aoi: shapely.MultiPolygon, distance: float) -> shapely.MultiPolygon:
-    utm = get_utm_zone(aoi)
-
-    geographic_projection_function = Transformer.from_crs(CAN_DEFAULT_CRS, utm, always_xy=True).transform
-    wgs84_projection_function = Transformer.from_crs(utm, CAN_DEFAULT_CRS, always_xy=True).transform
+def get_buffered_aoi(aoi: shapely.MultiPolygon, distance: float, projected_crs: CRS) -> shapely.MultiPolygon:
+    geographic_projection_function = get_transformer(CAN_DEFAULT_CRS, projected_crs).transform
+    wgs84_projection_function = get_transformer(projected_crs, CAN_DEFAULT_CRS).transform
     projected_aoi = transform(geographic_projection_function, aoi)
     buffered_aoi: shapely.MultiPolygon = projected_aoi.buffer(distance)
     return transform(wgs84_projection_function, buffered_aoi)
 
 
+@cache
+def get_transformer(crs_from: CRS, crs_to: CRS) -> Transformer:
+    # Building a transformer queries the PROJ database, so it is done once per CRS pair and then reused
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
 def get_utm_zone(aoi: shapely.MultiPolygon) -> CRS:
     return gpd.GeoSeries(data=aoi, crs=CAN_DEFAULT_CRS).estimate_utm_crs()
 
@@ -30,10 +36,11 @@ def calculate_length(length_resolution_m, paths, projected_crs):
 
 
 def length_weighted_mean(gdf: gpd.GeoDataFrame, col: str) -> float:
-    projected_data = gdf.to_crs(gdf.estimate_utm_crs())
+    # Only the geometries need projecting to get the lengths, not the whole frame
+    lengths = gdf.geometry.to_crs(gdf.estimate_utm_crs()).length
 
-    weighted_slopes = projected_data.length * projected_data[col]
+    weighted_slopes = lengths * gdf[col]
 
-    total_length = projected_data.length.sum()
+    total_length = lengths.sum()
     weighted_mean = weighted_slopes.sum() / total_length
     return weighted_mean
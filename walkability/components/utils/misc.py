@@ -1,10 +1,12 @@
 import logging
 from enum import Enum, StrEnum
-from typing import Dict, List, Optional, Tuple
+from functools import cache
+from typing import Dict, Optional, Sequence, Tuple
 from typing import SupportsFloat as Numeric
 
 import geopandas as gpd
 import matplotlib as mpl
+import numpy as np
 import pandas as pd
 import shapely
 from climatoology.base.exception import ClimatoologyUserError, InputValidationError
@@ -179,10 +181,9 @@ def fetch_osm_data(aoi: shapely.MultiPolygon, osm_filter: str, ohsome: OhsomeCli
 
 
 def _dict_to_legend(d: dict, cmap_name: str = 'coolwarm_r') -> Dict[str, Color]:
-    data = pd.DataFrame.from_records(data=list(d.items()), columns=['category', 'rating'])
-    data['color'] = generate_colors(color_by=data.rating, cmap_name=cmap_name, min_value=0.0, max_value=1.0)
-    data['category'] = data.category.apply(lambda cat: cat.value)
-    return dict(zip(data['category'], data['color']))
+    ratings = pd.Series(data=list(d.values()), dtype=float)
+    colors = generate_colors(color_by=ratings, cmap_name=cmap_name, min_value=0.0, max_value=1.0)
+    return {category.value: color for category, color in zip(d.keys(), colors)}
 
 
 def get_path_rating_legend() -> Dict[str, Color]:
@@ -233,12 +234,23 @@ def generate_colors(
 
     cmap.set_extremes(bad=bad_color)
 
-    mapped_colors = [Color(mpl.colors.to_hex(col)) for col in cmap(norm(color_by))]
-    colors = pd.Series(data=mapped_colors, index=color_by.index)
+    # A colormap only yields a limited set of distinct colors, so only create a `Color` once per distinct RGB value
+    rgb = np.round(cmap(norm(color_by))[:, :3] * 255).astype(np.uint8)
+    unique_rgb, inverse = np.unique(rgb, axis=0, return_inverse=True)
+    unique_colors = np.empty(len(unique_rgb), dtype=object)
+    unique_colors[:] = [_rgb_to_color(*col) for col in unique_rgb.tolist()]
+
+    colors = pd.Series(data=unique_colors[inverse.reshape(-1)], index=color_by.index)
     return colors
 
 
-def get_first_match(ordered_keys: List[str], tags: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+@cache
+def _rgb_to_color(red: int, green: int, blue: int) -> Color:
+    """Create (and validate) each `Color` only once across all calls to `generate_colors`."""
+    return Color(f'#{red:02x}{green:02x}{blue:02x}')
+
+
+def get_first_match(ordered_keys: Sequence[str], tags: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
     match_key = None
     match_value = None
     for key in ordered_keys:
@@ -277,7 +289,7 @@ def check_paths_count_limit(aoi: shapely.MultiPolygon, ohsome: OhsomeClient, cou
     Check whether paths count is over the limit. (NOTE: just check path_lines)
     """
     path_lines_count = ohsome.features_stats(aoi=aoi, osm_filter=ohsome_filter('line'), measure='count')
-    log.info(f'There are {path_lines_count} paths selected.')
+    log.info('There are %s paths selected.', path_lines_count)
     if path_lines_count > count_limit:
         raise InputValidationError(
             f'There are too many path segments in the selected area: {path_lines_count} path segments. '
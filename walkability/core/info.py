@@ -1,26 +1,33 @@
 import logging
 from datetime import timedelta
+from functools import cache
 from pathlib import Path
 
 from climatoology.base.plugin_info import Concern, PluginAuthor, PluginInfo, generate_plugin_info
 
 from walkability.core.input import ComputeInputWalkability
-from walkability.core.settings import FeatureFlags
-
-feature_flags = FeatureFlags()
+from walkability.core.settings import feature_flags
 
 log = logging.getLogger(__name__)
 
+ICON_PATH = Path('resources/info/walk.jpeg')
+PURPOSE_PATH = Path('resources/info/purpose.md')
+METHODOLOGY_PATH = Path('resources/info/methodology.md')
+METHODOLOGY_SHADE_PATH = Path('resources/info/methodology_shade.md')
+
 
 def get_info() -> PluginInfo:
-    if feature_flags.shade:
-        methodology_path = Path('resources/info/methodology_shade.md')
-    else:
-        methodology_path = Path('resources/info/methodology.md')
+    # The info is built once per process, callers get their own copy so they can't alter the shared instance
+    return _build_info().model_copy(deep=True)
+
+
+@cache
+def _build_info() -> PluginInfo:
+    methodology_path = METHODOLOGY_SHADE_PATH if feature_flags.shade else METHODOLOGY_PATH
 
     info = generate_plugin_info(
         name='hiWalk',
-        icon=Path('resources/info/walk.jpeg'),
+        icon=ICON_PATH,
         authors=[
             PluginAuthor(
                 name='Moritz Schott',
@@ -69,12 +76,12 @@ def get_info() -> PluginInfo:
             ),
         ],
         concerns={Concern.MOBILITY_PEDESTRIAN},
-        purpose=Path('resources/info/purpose.md'),
+        purpose=PURPOSE_PATH,
         teaser='Assess the safety, comfort, and quality of walkable infrastructure in an area of interest.',
         methodology=methodology_path,
         demo_input_parameters=ComputeInputWalkability(),
         computation_shelf_life=timedelta(weeks=24),
     )
-    log.info(f'Return info {info.model_dump()}')
+    log.debug('Return info %s', info)
 
     return info
@@ -3,9 +3,7 @@ from typing import Set
 
 from pydantic import BaseModel, Field
 
-from walkability.core.settings import FeatureFlags
-
-feature_flags = FeatureFlags()
+from walkability.core.settings import feature_flags
 
 
 class WalkabilityIndicators(Enum):
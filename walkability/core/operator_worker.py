@@ -105,7 +105,7 @@ class OperatorWalkability(BaseOperator[ComputeInputWalkability]):
         language: LanguageAlpha2 | None = None,
         **kwargs,
     ) -> list[Artifact]:
-        log.info(f'Handling compute request: {params.model_dump()} in context: {resources}')
+        log.info('Handling compute request: %s in context: %s', params, resources)
 
         artifacts = []
 
@@ -113,14 +113,16 @@ class OperatorWalkability(BaseOperator[ComputeInputWalkability]):
             check_paths_count_limit(aoi=aoi, ohsome=self.ohsome, count_limit=self.max_path_limit)
 
         line_paths, polygon_paths = self._get_paths(aoi=aoi)
+        projected_crs = None
 
         with self.catch_exceptions(indicator_name='Sub-district areal summary charts', resources=resources):
             areal_summaries = dict()  # Empty dict in case summaries fail
+            projected_crs = get_utm_zone(aoi)
             areal_summaries = summarise_by_area(
                 paths=line_paths,
                 aoi=aoi,
                 admin_level=self.admin_level,
-                projected_crs=get_utm_zone(aoi),
+                projected_crs=projected_crs,
                 ohsome_client=self.ohsome,
             )
 
@@ -131,7 +133,7 @@ class OperatorWalkability(BaseOperator[ComputeInputWalkability]):
                 (
                     aoi_summary_category_stacked_bar,
                     aoi_summary_quality_stacked_bar,
-                ) = summarise_aoi(paths=line_paths, projected_crs=get_utm_zone(aoi))
+                ) = summarise_aoi(paths=line_paths, projected_crs=projected_crs)
 
         path_artifacts = build_path_categorisation_artifact(
             paths_line=line_paths,
@@ -186,9 +188,13 @@ class OperatorWalkability(BaseOperator[ComputeInputWalkability]):
         if WalkabilityIndicators.COMFORT in params.optional_indicators:
             with self.catch_exceptions(indicator_name='Comfort Indicators', resources=resources):
                 log.info('Computing Comfort Indicators')
+                if projected_crs is None:
+                    # The summary charts failed before estimating the UTM zone, retry within this indicator
+                    projected_crs = get_utm_zone(aoi)
                 comfort_artifacts = compute_comfort_artifacts(
                     paths=line_paths,
                     aoi=aoi,
+                    projected_crs=projected_crs,
                     max_walking_distance_map=self.max_walking_distance_map,
                     ohsome_client=self.ohsome,
                     ors_settings=self.ors_settings,
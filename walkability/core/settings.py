@@ -19,3 +19,7 @@ class FeatureFlags(BaseSettings):
     shade: bool = False
 
     model_config = SettingsConfigDict(env_file='.env.feature', env_prefix='feature_flag_')  # dead: disable
+
+
+# Read once at import and shared by all modules, so the `.env.feature` file is only parsed a single time
+feature_flags = FeatureFlags()
@@ -30,7 +30,7 @@ def init_plugin(
         max_path_limit=initialised_settings.max_path_limit,
     )
 
-    log.info(f'Starting plugin: {operator.info().name}')
+    log.info('Starting plugin: %s', operator.info().name)
     return start_plugin(operator=operator)
 
 
@@ -48,4 +48,4 @@ if __name__ == '__main__':
         s3_settings=s3_settings,
         shade_config=shade_config,
     )
-    log.info(f'Plugin exited with exit code {exit_code}')
+    log.info('Plugin exited with exit code %s', exit_code)